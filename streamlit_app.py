@@ -6,31 +6,38 @@ import streamlit as st
 st.title("Week 1 - Data and visualization")
 st.markdown("Here we can see the dataframe created during this weeks project.")
 
-# Read dataframe
-dataframe = pd.read_csv(
-    "WK1_Airbnb_Amsterdam_listings_proj_solution.csv",
-    names=[
-        "Airbnb Listing ID",
-        "Price",
-        "Latitude",
-        "Longitude",
-        "Meters from chosen location",
-        "Location",
-    ],
-)
+# Read and prepare the dataframe once; Streamlit reruns the whole script on
+# every interaction, so cache the result instead of re-parsing the CSV
+@st.cache_data
+def load_data():
+    dataframe = pd.read_csv(
+        "WK1_Airbnb_Amsterdam_listings_proj_solution.csv",
+        names=[
+            "Airbnb Listing ID",
+            "Price",
+            "Latitude",
+            "Longitude",
+            "Meters from chosen location",
+            "Location",
+        ],
+    )
 
-# We have a limited budget, therefore we would like to exclude
-# listings with a price above 100 pounds per night
-dataframe = dataframe[dataframe["Price"] <= 100]
-
-# Display as integer
-dataframe["Airbnb Listing ID"] = dataframe["Airbnb Listing ID"].astype(int)
-# Round of values
-dataframe["Price"] = "£ " + dataframe["Price"].round(2).astype(str) # <--- CHANGE THIS POUND SYMBOL IF YOU CHOSE CURRENCY OTHER THAN POUND
-# Rename the number to a string
-dataframe["Location"] = dataframe["Location"].replace(
-    {1.0: "To visit", 0.0: "Airbnb listing"}
-)
+    # We have a limited budget, therefore we would like to exclude
+    # listings with a price above 100 pounds per night
+    dataframe = dataframe[dataframe["Price"] <= 100]
+
+    # Display as integer
+    dataframe["Airbnb Listing ID"] = dataframe["Airbnb Listing ID"].astype(int)
+    # Round of values
+    dataframe["Price"] = "£ " + dataframe["Price"].round(2).astype(str) # <--- CHANGE THIS POUND SYMBOL IF YOU CHOSE CURRENCY OTHER THAN POUND
+    # Rename the number to a string
+    dataframe["Location"] = dataframe["Location"].replace(
+        {1.0: "To visit", 0.0: "Airbnb listing"}
+    )
+    return dataframe
+
+
+dataframe = load_data()
 
 # Display dataframe and text
 st.dataframe(dataframe)